@@ -21,6 +21,7 @@ from homeassistant.components.vacuum import (
 from homeassistant.config_entries import SOURCE_IMPORT, ConfigEntry
 from homeassistant.exceptions import ConfigEntryNotReady
 import homeassistant.helpers.config_validation as cv
+from homeassistant.helpers.debounce import Debouncer
 from homeassistant.helpers.entity import DeviceInfo
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.typing import ConfigType
@@ -32,11 +33,13 @@ from .const import (
     ERRORS,
     MIN_TIME_BETWEEN_UPDATES,
     MODE,
+    REQUEST_REFRESH_COOLDOWN,
     ROBOT_CLEANING_ACTIONS,
     ROBOT_STATE_BUSY,
     ROBOT_STATE_ERROR,
     ROBOT_STATE_IDLE,
     ROBOT_STATE_PAUSE,
+    VORWERK_CMD_LOCK,
     VORWERK_DOMAIN,
     VORWERK_PLATFORMS,
     VORWERK_ROBOT_API,
@@ -100,9 +103,21 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
                 VORWERK_ROBOT_COORDINATOR: _create_coordinator(hass, r),
             }
             for r in robot_states
-        ]
+        ],
+        # Robots on one account share a rate-limited API; serializing
+        # commands avoids spawning one executor worker per robot on fan-out.
+        VORWERK_CMD_LOCK: asyncio.Lock(),
     }
 
+    # Prime robot state once so platforms can add entities without
+    # requesting another update per entity.
+    await asyncio.gather(
+        *(
+            robot[VORWERK_ROBOT_COORDINATOR].async_config_entry_first_refresh()
+            for robot in hass.data[VORWERK_DOMAIN][entry.entry_id][VORWERK_ROBOTS]
+        )
+    )
+
     # Forward entry setups for all platforms at once (awaited)
     await hass.config_entries.async_forward_entry_setups(entry, VORWERK_PLATFORMS)
 
@@ -122,6 +137,10 @@ def _create_coordinator(
         name=robot_state.robot.name,
         update_method=async_update_data,
         update_interval=MIN_TIME_BETWEEN_UPDATES,
+        # Coalesce bursts of user-triggered refreshes into one poll.
+        request_refresh_debouncer=Debouncer(
+            hass, _LOGGER, cooldown=REQUEST_REFRESH_COOLDOWN, immediate=False
+        ),
     )
 
 
@@ -166,6 +185,9 @@ class VorwerkState:
         self.robot = robot
         self.robot_state: dict[Any, Any] = {}
         self.robot_info: dict[Any, Any] = {}
+        self._battery_level: int | None = None
+        self.boundaries: list[dict[str, Any]] = []
+        self.boundary_index: dict[str, str] = {}
 
     @property
     def available(self) -> bool:
@@ -177,6 +199,7 @@ class VorwerkState:
         _LOGGER.debug("Running Vorwerk Vacuums update for '%s'", self.robot.name)
         self._update_robot_info()
         self._update_state()
+        self._update_boundaries()
 
     def _update_robot_info(self):
         try:
@@ -195,7 +218,29 @@ class VorwerkState:
                     "Vorwerk vacuum connection error for '%s': %s", self.robot.name, ex
                 )
             self.robot_state = {}
+            self._battery_level = None
+            return
+        charge = self.robot_state["details"]["charge"]
+        self._battery_level = int(charge) if charge is not None else None
+
+    def _update_boundaries(self):
+        """Fetch zone boundaries in the same executor pass as the state."""
+        if "maps" not in self.robot_state.get("availableServices", {}):
             return
+        try:
+            boundaries = (
+                self.robot.get_map_boundaries()
+                .json()
+                .get("data", {})
+                .get("boundaries", [])
+            )
+        except NeatoRobotException:
+            _LOGGER.warning("Couldn't fetch map boundaries of %s", self.robot.name)
+            return
+        self.boundaries = boundaries
+        self.boundary_index = {
+            boundary["name"]: boundary["id"] for boundary in boundaries
+        }
 
     @property
     def docked(self) -> bool | None:
@@ -294,11 +339,11 @@ class VorwerkState:
         return " ".join(s for s in status_items if s)
 
     @property
-    def battery_level(self) -> str | None:
+    def battery_level(self) -> int | None:
         """Return the battery level of the vacuum cleaner."""
         if not self.available:
             return None
-        return self.robot_state["details"]["charge"]
+        return self._battery_level
 
     @property
     def device_info(self) -> DeviceInfo:
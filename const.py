@@ -10,6 +10,7 @@ VORWERK_DOMAIN = "vorwerk"
 VORWERK_ROBOTS = "robots"
 VORWERK_ROBOT_API = "robot_api"
 VORWERK_ROBOT_COORDINATOR = "robot_coordinator"
+VORWERK_CMD_LOCK = "cmd_lock"
 
 # Robot attributes
 VORWERK_ROBOT_NAME = "name"
@@ -27,6 +28,9 @@ VORWERK_CLIENT_ID = "KY4YbVAvtgB7lp8vIbWQ7zLk3hssZlhR"
 # Coordinator refresh interval
 MIN_TIME_BETWEEN_UPDATES = timedelta(minutes=1)
 
+# Cooldown (seconds) for coalescing user-triggered refresh requests
+REQUEST_REFRESH_COOLDOWN = 2.0
+
 # Service/attribute keys (if used by services or options)
 ATTR_NAVIGATION = "navigation"
 ATTR_CATEGORY = "category"
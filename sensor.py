@@ -7,7 +7,7 @@ from typing import Any
 from pybotvac.robot import Robot
 
 from homeassistant.components.sensor import SensorDeviceClass
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import PERCENTAGE
 from homeassistant.helpers.entity import Entity
@@ -34,11 +34,11 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry, async_add_e
     """Set up the Vorwerk sensor using config entry."""
     _LOGGER.debug("Adding sensors for vorwerk robots")
     async_add_entities(
-        [
+        (
             VorwerkSensor(robot[VORWERK_ROBOT_API], robot[VORWERK_ROBOT_COORDINATOR])
             for robot in hass.data[VORWERK_DOMAIN][entry.entry_id][VORWERK_ROBOTS]
-        ],
-        True,
+        ),
+        False,
     )
 
 
@@ -52,38 +52,27 @@ class VorwerkSensor(CoordinatorEntity, Entity):
         super().__init__(coordinator)
         self.robot: Robot = robot_state.robot
         self._state: VorwerkState = robot_state
-        self._robot_name = f"{self.robot.name} {BATTERY}"
-        self._robot_serial = self.robot.serial
-
-    @property
-    def name(self) -> str:
-        """Return the name of this sensor."""
-        return self._robot_name
-
-    @property
-    def unique_id(self) -> str:
-        """Return unique ID."""
-        return self._robot_serial
-
-    @property
-    def device_class(self) -> SensorDeviceClass | None:
-        """Return the device class."""
-        return SensorDeviceClass.BATTERY
+        self._attr_name = f"{self.robot.name} {BATTERY}"
+        self._attr_unique_id = self.robot.serial
+        self._attr_device_class = SensorDeviceClass.BATTERY
+        self._attr_unit_of_measurement = PERCENTAGE
+        self._update_cached_attrs()
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Recompute cached values when the coordinator updates."""
+        self._update_cached_attrs()
+        super()._handle_coordinator_update()
+
+    def _update_cached_attrs(self) -> None:
+        """Cache values derived from the robot state."""
+        self._attr_available = self._state.available
+        self._attr_state = self._state.battery_level
 
     @property
     def available(self) -> bool:
         """Return availability."""
-        return self._state.available
-
-    @property
-    def state(self) -> str | None:
-        """Return the state."""
-        return self._state.battery_level
-
-    @property
-    def unit_of_measurement(self) -> str:
-        """Return unit of measurement."""
-        return PERCENTAGE
+        return self._attr_available
 
     @property
     def device_info(self):
@@ -2,7 +2,7 @@
 from __future__ import annotations
 
 import logging
-from typing import Any
+from typing import Any, Callable
 
 from pybotvac.exceptions import NeatoRobotException
 from pybotvac.robot import Robot
@@ -41,7 +41,7 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry, async_add_e
     if not dev:
         return
 
-    async_add_entities(dev, True)
+    async_add_entities(dev, False)
 
 
 class VorwerkScheduleSwitch(CoordinatorEntity, ToggleEntity):
@@ -82,30 +82,25 @@ class VorwerkScheduleSwitch(CoordinatorEntity, ToggleEntity):
         """Device info for robot."""
         return self._state.device_info
 
+    def _sync_call(self, command: Callable[[], Any]) -> None:
+        """Invoke a robot command with shared error handling (executor)."""
+        try:
+            command()
+        except NeatoRobotException as ex:
+            _LOGGER.error(
+                "Vorwerk switch connection error '%s': %s", self.entity_id, ex
+            )
+
     async def async_turn_on(self, **kwargs: Any) -> None:
         """Turn the switch on."""
-
-        def turn_on():
-            try:
-                self.robot.enable_schedule()
-            except NeatoRobotException as ex:
-                _LOGGER.error(
-                    "Vorwerk switch connection error '%s': %s", self.entity_id, ex
-                )
-
-        await self.hass.async_add_executor_job(turn_on)
+        await self.hass.async_add_executor_job(
+            self._sync_call, self.robot.enable_schedule
+        )
         await self.coordinator.async_request_refresh()
 
     async def async_turn_off(self, **kwargs: Any) -> None:
         """Turn the switch off."""
-
-        def turn_off():
-            try:
-                self.robot.disable_schedule()
-            except NeatoRobotException as ex:
-                _LOGGER.error(
-                    "Vorwerk switch connection error '%s': %s", self.entity_id, ex
-                )
-
-        await self.hass.async_add_executor_job(turn_off)
+        await self.hass.async_add_executor_job(
+            self._sync_call, self.robot.disable_schedule
+        )
         await self.coordinator.async_request_refresh()
@@ -1,8 +1,9 @@
 """Support for Vorwerk Connected Vacuums."""
 from __future__ import annotations
 
+import asyncio
 import logging
-from typing import Any
+from typing import Any, Callable, Final
 
 import voluptuous as vol
 from pybotvac.robot import Robot
@@ -18,7 +19,7 @@ from homeassistant.components.vacuum import (
     VacuumEntityFeature,
 )
 from homeassistant.const import ATTR_MODE
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.helpers import config_validation as cv, entity_platform
 from homeassistant.helpers.entity import DeviceInfo
@@ -33,6 +34,7 @@ from .const import (
     ATTR_CATEGORY,
     ATTR_NAVIGATION,
     ATTR_ZONE,
+    VORWERK_CMD_LOCK,
     VORWERK_DOMAIN,
     VORWERK_ROBOT_API,
     VORWERK_ROBOT_COORDINATOR,
@@ -41,7 +43,7 @@ from .const import (
 
 _LOGGER = logging.getLogger(__name__)
 
-SUPPORTED_FEATURES = (
+SUPPORTED_FEATURES: Final[int] = (
     VacuumEntityFeature.START
     | VacuumEntityFeature.STOP
     | VacuumEntityFeature.RETURN_HOME
@@ -50,17 +52,27 @@ SUPPORTED_FEATURES = (
     | VacuumEntityFeature.LOCATE
 )
 
+# States from which a start command begins a new cleaning run; from
+# paused it resumes instead.
+_STARTABLE_STATES: Final = frozenset({STATE_IDLE, STATE_DOCKED})
+_START_COMMAND_STATES: Final = _STARTABLE_STATES | {STATE_PAUSED}
+
 
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry, async_add_entities: AddEntitiesCallback) -> None:
     """Set up Vorwerk vacuum with config entry."""
     _LOGGER.debug("Adding vorwerk vacuums")
-    entities = [
-        VorwerkConnectedVacuum(
-            robot[VORWERK_ROBOT_API], robot[VORWERK_ROBOT_COORDINATOR]
-        )
-        for robot in hass.data[VORWERK_DOMAIN][entry.entry_id][VORWERK_ROBOTS]
-    ]
-    async_add_entities(entities, True)
+    entry_data = hass.data[VORWERK_DOMAIN][entry.entry_id]
+    async_add_entities(
+        (
+            VorwerkConnectedVacuum(
+                robot[VORWERK_ROBOT_API],
+                robot[VORWERK_ROBOT_COORDINATOR],
+                entry_data[VORWERK_CMD_LOCK],
+            )
+            for robot in entry_data[VORWERK_ROBOTS]
+        ),
+        False,
+    )
 
     # Register the custom cleaning service within the platform context
     platform = entity_platform.async_get_current_platform()
@@ -80,150 +92,108 @@ class VorwerkConnectedVacuum(CoordinatorEntity, StateVacuumEntity):
     """Representation of a Vorwerk Connected Vacuum."""
 
     def __init__(
-        self, robot_state: VorwerkState, coordinator: DataUpdateCoordinator[Any]
+        self,
+        robot_state: VorwerkState,
+        coordinator: DataUpdateCoordinator[Any],
+        cmd_lock: asyncio.Lock,
     ) -> None:
         """Initialize the Vorwerk Connected Vacuum."""
         super().__init__(coordinator)
         self.robot: Robot = robot_state.robot
         self._state: VorwerkState = robot_state
-        self._name = f"{self.robot.name}"
-        self._robot_serial = self.robot.serial
-        self._robot_boundaries: list = []
+        self._cmd_lock = cmd_lock
+        self._attr_name = f"{self.robot.name}"
+        self._attr_unique_id = self.robot.serial
+        self._attr_icon = "mdi:robot-vacuum-variant"
         self._attr_supported_features = SUPPORTED_FEATURES
-
-    @property
-    def name(self) -> str:
-        """Return the name of the device."""
-        return self._name
-
-    @property
-    def supported_features(self) -> int:
-        """Flag vacuum cleaner robot features that are supported."""
-        return SUPPORTED_FEATURES
-
-    @property
-    def battery_level(self) -> int | None:
-        """Return the battery level of the vacuum cleaner."""
-        return int(self._state.battery_level) if self._state.battery_level else None
+        self._update_cached_attrs()
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Recompute cached values when the coordinator updates."""
+        self._update_cached_attrs()
+        super()._handle_coordinator_update()
+
+    def _update_cached_attrs(self) -> None:
+        """Cache values derived from the robot state."""
+        self._attr_available = self._state.available
+        self._attr_state = self._state.state
+        self._attr_battery_level = self._state.battery_level
+        data: dict[str, Any] = {}
+        if self._state.status is not None:
+            data[ATTR_STATUS] = self._state.status
+        self._attr_extra_state_attributes = data
 
     @property
     def available(self) -> bool:
         """Return if the robot is available."""
-        return self._state.available
-
-    @property
-    def icon(self) -> str:
-        """Return specific icon."""
-        return "mdi:robot-vacuum-variant"
-
-    @property
-    def state(self) -> str | None:
-        """Return the status of the vacuum cleaner."""
-        return self._state.state if self._state else None
-
-    @property
-    def unique_id(self) -> str:
-        """Return a unique ID."""
-        return self._robot_serial
-
-    @property
-    def extra_state_attributes(self) -> dict[str, Any]:
-        """Return the state attributes of the vacuum cleaner."""
-        data: dict[str, Any] = {}
-        if self._state.status is not None:
-            data[ATTR_STATUS] = self._state.status
-        return data
+        return self._attr_available
 
     @property
     def device_info(self) -> DeviceInfo:
         """Device info for robot."""
         return self._state.device_info
 
+    async def _run_command(self, command: Callable[..., Any], *args: Any) -> None:
+        """Run a robot command and refetch state in a single executor job."""
+        async with self._cmd_lock:
+            await self.hass.async_add_executor_job(
+                self._exec_and_refetch, command, *args
+            )
+
+    def _exec_and_refetch(self, command: Callable[..., Any], *args: Any) -> None:
+        """Invoke a robot command and refetch state (runs in the executor)."""
+        try:
+            command(*args)
+            self._state.update()
+        except NeatoRobotException as ex:
+            _LOGGER.error(
+                "Vorwerk vacuum connection error for '%s': %s", self.entity_id, ex
+            )
+        self.hass.loop.call_soon_threadsafe(self._handle_coordinator_update)
+
+    def _start_cleaning(self) -> None:
+        """Start a new run or resume a paused one (runs in the executor)."""
+        if self._state.state in _STARTABLE_STATES:
+            self.robot.start_cleaning()
+        elif self._state.state == STATE_PAUSED:
+            self.robot.resume_cleaning()
+
+    def _pause_and_send_to_base(self) -> None:
+        """Pause if cleaning, then return to base (runs in the executor)."""
+        if self._state.state == STATE_CLEANING:
+            self.robot.pause_cleaning()
+        self.robot.send_to_base()
+
     async def async_start(self) -> None:
         """Start cleaning or resume cleaning."""
-        if not self._state:
+        if self._state.state not in _START_COMMAND_STATES:
             return
-
-        def _do():
-            try:
-                if self._state.state in (STATE_IDLE, STATE_DOCKED):
-                    self.robot.start_cleaning()
-                elif self._state.state == STATE_PAUSED:
-                    self.robot.resume_cleaning()
-            except NeatoRobotException as ex:
-                _LOGGER.error(
-                    "Vorwerk vacuum connection error for '%s': %s", self.entity_id, ex
-                )
-
-        await self.hass.async_add_executor_job(_do)
-        await self.coordinator.async_request_refresh()
+        await self._run_command(self._start_cleaning)
 
     async def async_pause(self) -> None:
         """Pause the vacuum."""
-        def _do():
-            try:
-                self.robot.pause_cleaning()
-            except NeatoRobotException as ex:
-                _LOGGER.error(
-                    "Vorwerk vacuum connection error for '%s': %s", self.entity_id, ex
-                )
-
-        await self.hass.async_add_executor_job(_do)
-        await self.coordinator.async_request_refresh()
+        if self._state.state != STATE_CLEANING:
+            return
+        await self._run_command(self.robot.pause_cleaning)
 
     async def async_return_to_base(self, **kwargs: Any) -> None:
         """Set the vacuum cleaner to return to the dock."""
-        def _do():
-            try:
-                if self._state.state == STATE_CLEANING:
-                    self.robot.pause_cleaning()
-                self.robot.send_to_base()
-            except NeatoRobotException as ex:
-                _LOGGER.error(
-                    "Vorwerk vacuum connection error for '%s': %s", self.entity_id, ex
-                )
-
-        await self.hass.async_add_executor_job(_do)
-        await self.coordinator.async_request_refresh()
+        if self._state.state == STATE_DOCKED:
+            return
+        await self._run_command(self._pause_and_send_to_base)
 
     async def async_stop(self, **kwargs: Any) -> None:
         """Stop the vacuum cleaner."""
-        def _do():
-            try:
-                self.robot.stop_cleaning()
-            except NeatoRobotException as ex:
-                _LOGGER.error(
-                    "Vorwerk vacuum connection error for '%s': %s", self.entity_id, ex
-                )
-
-        await self.hass.async_add_executor_job(_do)
-        await self.coordinator.async_request_refresh()
+        await self._run_command(self.robot.stop_cleaning)
 
     async def async_locate(self, **kwargs: Any) -> None:
         """Locate the robot by making it emit a sound."""
-        def _do():
-            try:
-                self.robot.locate()
-            except NeatoRobotException as ex:
-                _LOGGER.error(
-                    "Vorwerk vacuum connection error for '%s': %s", self.entity_id, ex
-                )
-
-        await self.hass.async_add_executor_job(_do)
-        await self.coordinator.async_request_refresh()
+        await self._run_command(self.robot.locate)
 
     async def async_clean_spot(self, **kwargs: Any) -> None:
         """Run a spot cleaning starting from the base."""
-        def _do():
-            try:
-                self.robot.start_spot_cleaning()
-            except NeatoRobotException as ex:
-                _LOGGER.error(
-                    "Vorwerk vacuum connection error for '%s': %s", self.entity_id, ex
-                )
-
-        await self.hass.async_add_executor_job(_do)
-        await self.coordinator.async_request_refresh()
+        await self._run_command(self.robot.start_spot_cleaning)
 
     async def vorwerk_custom_cleaning(
         self, mode: int, navigation: int, category: int, zone: str | None = None
@@ -231,23 +201,30 @@ class VorwerkConnectedVacuum(CoordinatorEntity, StateVacuumEntity):
         """Zone cleaning service call."""
         boundary_id = None
         if zone is not None:
-            for boundary in self._robot_boundaries:
-                if zone in boundary["name"]:
-                    boundary_id = boundary["id"]
+            if not self._state.boundaries:
+                _LOGGER.error(
+                    "Zone '%s' was requested but no boundaries are known for the robot '%s'",
+                    zone,
+                    self.entity_id,
+                )
+                return
+            boundary_id = self._state.boundary_index.get(zone)
+            if boundary_id is None:
+                # Fall back to the old substring match when there is no
+                # exact name hit.
+                for boundary in self._state.boundaries:
+                    if zone in boundary["name"]:
+                        boundary_id = boundary["id"]
             if boundary_id is None:
                 _LOGGER.error(
                     "Zone '%s' was not found for the robot '%s'", zone, self.entity_id
                 )
                 return
-            _LOGGER.info("Start cleaning zone '%s' with robot %s", zone, self.entity_id)
-
-        def _do():
-            try:
-                self.robot.start_cleaning(mode, navigation, category, boundary_id)
-            except NeatoRobotException as ex:
-                _LOGGER.error(
-                    "Vorwerk vacuum connection error for '%s': %s", self.entity_id, ex
+            if _LOGGER.isEnabledFor(logging.INFO):
+                _LOGGER.info(
+                    "Start cleaning zone '%s' with robot %s", zone, self.entity_id
                 )
 
-        await self.hass.async_add_executor_job(_do)
-        await self.coordinator.async_request_refresh()
+        await self._run_command(
+            self.robot.start_cleaning, mode, navigation, category, boundary_id
+        )